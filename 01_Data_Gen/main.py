@@ -1,16 +1,27 @@
 import argparse
-import json
+import asyncio
+import multiprocessing
 import os
 import random
+import sys
 import time
-import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Literal, Optional
-
-from pydantic import BaseModel 
-import requests
+from typing import Any, Dict, Literal, Optional, Union
+
+from pydantic import BaseModel
+try:
+    import aiohttp
+except ImportError:  # sync fallback over a pooled requests.Session below
+    aiohttp = None
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
+try:  # Rust-backed UUID construction/formatting is several times faster
+    from uuid_utils import UUID as _UUID
+except ImportError:  # optional accelerator; stdlib works the same
+    from uuid import UUID as _UUID
+
 class CitizenToBusiness(BaseModel):
     businessRegID: str
     citizenID: str
@@ -34,6 +45,31 @@ def init() -> None:
     URL = os.getenv("MOCK_DATA_URL")
 
 
+# Buffered urandom: refill in 4 KiB blocks and slice from the buffer instead of
+# paying a syscall per uuid4()/os.urandom() call in the generation loop.
+_RND_BUF = bytearray(4096)
+_RND_OFF = [len(_RND_BUF)]
+
+
+def _rand_bytes(n: int) -> bytes:
+    if _RND_OFF[0] + n > len(_RND_BUF):
+        _RND_BUF[:] = os.urandom(len(_RND_BUF))
+        _RND_OFF[0] = 0
+    off = _RND_OFF[0]
+    _RND_OFF[0] += n
+    return bytes(_RND_BUF[off:off + n])
+
+
+def _rand_uuid() -> str:
+    # Set the RFC-4122 version/variant bits ourselves: uuid_utils applies the
+    # version nibble but not the variant clamp, so passing version=4 yields
+    # different (and mostly spec-invalid) ids than the stdlib would
+    b = bytearray(_rand_bytes(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    return str(_UUID(bytes=bytes(b)))
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -42,77 +78,133 @@ def _rand_amount(min_val: float = 1.0, max_val: float = 1000.0) -> float:
     return round(random.uniform(min_val, max_val), 2)
 
 
+_CCY = ("USD", "EUR", "ZAR", "GBP", "KES", "NGN")
+
+
 def _rand_currency() -> str:
-    return random.choice(["USD", "EUR", "ZAR", "GBP", "KES", "NGN"])
+    return random.choice(_CCY)
+
+
+# Sampled populations as module-level tuples: no per-call list allocation
+_FIRST_NAMES = ("Alex", "Sam", "Jamie", "Taylor", "Jordan", "Casey", "Riley", "Morgan")
+_LAST_NAMES = ("Smith", "Johnson", "Brown", "Williams", "Jones", "Miller", "Davis")
+_C2B_PRODUCTS = ("Groceries", "Airtime", "Electricity", "Clothing", "Fuel", "Pharmacy")
+_B2B_PRODUCTS = ("WholesaleFood", "Electronics", "Clothing", "Stationery", "CleaningSupplies")
+_CHANNELS = ("USSD", "APP", "WEB", "POS")
+_PAYEES = ("Shoprite", "Pick n Pay", "Spar", "Woolworths", "Checkers")
+_DESCRIPTIONS = ("Groceries", "Airtime", "Electricity", "Clothing", "Fuel")
+_CITIES = ("Cape Town", "Johannesburg", "Durban", "Pretoria", "Gqeberha")
 
 
 def _rand_name() -> str:
-    first = random.choice(["Alex", "Sam", "Jamie", "Taylor", "Jordan", "Casey", "Riley", "Morgan"])  # noqa: E501
-    last = random.choice(["Smith", "Johnson", "Brown", "Williams", "Jones", "Miller", "Davis"])  # noqa: E501
-    return f"{first} {last}"
+    return f"{random.choice(_FIRST_NAMES)} {random.choice(_LAST_NAMES)}"
 
 
 def _rand_phone() -> str:
     return "+27" + str(random.randint(600000000, 799999999))
 
 
-def _pydantic_dump(model: BaseModel) -> Dict[str, Any]:
-    """Return a plain dict from a Pydantic model for v1 or v2."""
-    # pydantic v2: model_dump; v1: dict
-    dump_fn = getattr(model, "model_dump", None)
-    if callable(dump_fn):  # type: ignore[truthy-function]
-        return dump_fn()  # type: ignore[no-any-return]
-    return model.dict()  # type: ignore[no-any-return]
+# v1/v2 dump branch resolved once at import, not per payload.
+# pydantic v2 serializes straight to JSON; v1 goes dict() -> orjson.
+if hasattr(BaseModel, "model_dump_json"):
+    def _dump_json(model: BaseModel) -> bytes:
+        return model.model_dump_json().encode()
+else:
+    def _dump_json(model: BaseModel) -> bytes:
+        return orjson.dumps(model.dict())
+
+
+# Vectorized pre-sampling: for a finite --count run, the iso8583 scalar fields
+# are drawn for the whole run in a few NumPy calls instead of ~10 random.*
+# invocations per message. Infinite runs fall back to the scalar path.
+_RNG = np.random.default_rng()
+_CCY_ARR = np.array(_CCY)
+_ISO8583_BATCH: Optional[Dict[str, Any]] = None
+_ISO8583_IDX = 0
+
+
+def presample_iso8583(n: int) -> None:
+    """Pre-draw the random scalars for up to n iso8583 messages."""
+    global _ISO8583_BATCH, _ISO8583_IDX
+    _ISO8583_BATCH = {
+        "stan": _RNG.integers(100000, 1000000, size=n),
+        "amount": np.round(_RNG.uniform(5, 500, size=n) * 100).astype(np.int64),
+        "card": _RNG.integers(10**14, 10**15, size=n, dtype=np.int64),
+        "terminal": _RNG.integers(1000, 10000, size=n),
+        "merchant": _RNG.integers(100000, 1000000, size=n),
+        "currency": _RNG.choice(_CCY_ARR, size=n),
+    }
+    _ISO8583_IDX = 0
 
 
 def gen_iso_8583() -> Dict[str, Any]:
     """Return a simplified ISO 8583-like payload (JSON representation)."""
-    stan = random.randint(100000, 999999)  # Systems Trace Audit Number
-    rrn = str(uuid.uuid4())[:12].replace("-", "").upper()
+    global _ISO8583_IDX
+    batch = _ISO8583_BATCH
+    if batch is not None and _ISO8583_IDX < len(batch["stan"]):
+        i = _ISO8583_IDX
+        _ISO8583_IDX = i + 1
+        stan = int(batch["stan"][i])  # Systems Trace Audit Number
+        amount = int(batch["amount"][i])
+        card_number = "4" + str(batch["card"][i])
+        terminal_id = f"TERM{batch['terminal'][i]}"
+        merchant_id = f"MRC{batch['merchant'][i]}"
+        currency = str(batch["currency"][i])
+    else:
+        stan = random.randint(100000, 999999)  # Systems Trace Audit Number
+        amount = int(_rand_amount(5, 500) * 100)
+        # 15 digits from 7 buffered bytes; skips randint's big-int path
+        card_number = "4" + f"{int.from_bytes(_rand_bytes(7), 'little') % 10**15:015d}"
+        terminal_id = f"TERM{random.randint(1000,9999)}"
+        merchant_id = f"MRC{random.randint(100000,999999)}"
+        currency = _rand_currency()
+    rrn = _rand_uuid()[:12].replace("-", "").upper()
+    now = datetime.now(timezone.utc)  # one clock read per message
     payload = {
         "mti": "0200",
         "processingCode": "000000",
-        "amount": int(_rand_amount(5, 500) * 100),  # in minor units
-        "transmissionDateTime": datetime.utcnow().strftime("%m%d%H%M%S"),
+        "amount": amount,  # in minor units
+        "transmissionDateTime": now.strftime("%m%d%H%M%S"),
         "stan": stan,
         "rrn": rrn,
-        "cardNumber": "4" + str(random.randint(10**14, 10**15 - 1)),
-        "expiry": datetime.utcnow().strftime("%m%y"),
+        "cardNumber": card_number,
+        "expiry": now.strftime("%m%y"),
         "posEntryMode": "012",
         "acquirerId": "000001",
-        "terminalId": f"TERM{random.randint(1000,9999)}",
-        "merchantId": f"MRC{random.randint(100000,999999)}",
-        "currency": _rand_currency(),
+        "terminalId": terminal_id,
+        "merchantId": merchant_id,
+        "currency": currency,
         "cardholderName": _rand_name(),
         "description": "Purchase",
-        "timestamp": _now_iso(),
+        "timestamp": now.isoformat(),
     }
     return payload
 
 
 def gen_iso_20022() -> Dict[str, Any]:
     """Return a simplified ISO 20022 pain.001-like payload."""
-    tx_id = str(uuid.uuid4())
+    tx_id = _rand_uuid()
     debtor = _rand_name()
     creditor = _rand_name()
     amount = _rand_amount(10, 1500)
     currency = _rand_currency()
+    now = datetime.now(timezone.utc)  # one clock read per message
     payload = {
         "CstmrCdtTrfInitn": {
             "GrpHdr": {
                 "MsgId": tx_id,
-                "CreDtTm": _now_iso(),
+                "CreDtTm": now.isoformat(),
                 "NbOfTxs": "1",
             },
             "PmtInf": [
                 {
                     "PmtInfId": f"PMT-{tx_id[:8]}",
                     "PmtMtd": "TRF",
-                    "ReqdExctnDt": datetime.utcnow().strftime("%Y-%m-%d"),
+                    "ReqdExctnDt": now.strftime("%Y-%m-%d"),
                     "Dbtr": {"Nm": debtor},
-                    "DbtrAcct": {"Id": {"IBAN": f"DE89{random.randint(10**16, 10**17-1)}"}},
+                    "DbtrAcct": {"Id": {"IBAN": f"DE89{int.from_bytes(_rand_bytes(8), 'little') % 10**17:017d}"}},
                     "Cdtr": {"Nm": creditor},
-                    "CdtrAcct": {"Id": {"IBAN": f"GB29{random.randint(10**16, 10**17-1)}"}},
+                    "CdtrAcct": {"Id": {"IBAN": f"GB29{int.from_bytes(_rand_bytes(8), 'little') % 10**17:017d}"}},
                     "CdtTrfTxInf": [
                         {
                             "PmtId": {"EndToEndId": tx_id},
@@ -127,18 +219,10 @@ def gen_iso_20022() -> Dict[str, Any]:
     return payload
 
 
-def gen_model_citizen_to_business() -> Dict[str, Any]:
-    """Generate a CitizenToBusiness payload using the Pydantic model."""
+def gen_model_citizen_to_business() -> bytes:
+    """Generate a CitizenToBusiness payload as JSON bytes via the Pydantic model."""
     # Build a small random products dict with 1-3 entries of quantities
-    product_names = [
-        "Groceries",
-        "Airtime",
-        "Electricity",
-        "Clothing",
-        "Fuel",
-        "Pharmacy",
-    ]
-    items = random.sample(product_names, k=random.randint(1, min(3, len(product_names))))
+    items = random.sample(_C2B_PRODUCTS, k=random.randint(1, 3))
     products = {name: random.randint(1, 5) for name in items}
 
     model = CitizenToBusiness(
@@ -147,19 +231,12 @@ def gen_model_citizen_to_business() -> Dict[str, Any]:
         products=products,
         time=_now_iso(),
     )
-    return _pydantic_dump(model)
-
-
-def gen_model_business_to_business() -> Dict[str, Any]:
-    """Generate a BusinessToBusiness payload using the Pydantic model."""
-    product_names = [
-        "WholesaleFood",
-        "Electronics",
-        "Clothing",
-        "Stationery",
-        "CleaningSupplies",
-    ]
-    items = random.sample(product_names, k=random.randint(1, min(3, len(product_names))))
+    return _dump_json(model)
+
+
+def gen_model_business_to_business() -> bytes:
+    """Generate a BusinessToBusiness payload as JSON bytes via the Pydantic model."""
+    items = random.sample(_B2B_PRODUCTS, k=random.randint(1, 3))
     products = {name: random.randint(1, 20) for name in items}
 
     model = BusinessToBusiness(
@@ -168,42 +245,46 @@ def gen_model_business_to_business() -> Dict[str, Any]:
         products=products,
         time=_now_iso(),
     )
-    return _pydantic_dump(model)
+    return _dump_json(model)
 
 
 def gen_citizen_to_business() -> Dict[str, Any]:
     """Return a simple CitizenToBusiness JSON object."""
-    transaction_id = str(uuid.uuid4())
+    transaction_id = _rand_uuid()
     amount = _rand_amount(1, 1000)
     currency = _rand_currency()
     payload = {
         "type": "CitizenToBusiness",
         "transactionId": transaction_id,
-        "channel": random.choice(["USSD", "APP", "WEB", "POS"]),
+        "channel": random.choice(_CHANNELS),
         "payer": {
             "name": _rand_name(),
             "msisdn": _rand_phone(),
             "idNumber": str(random.randint(7001010000000, 9912319999999)),
         },
         "payee": {
-            "name": random.choice(["Shoprite", "Pick n Pay", "Spar", "Woolworths", "Checkers"]),
+            "name": random.choice(_PAYEES),
             "merchantId": f"MER{random.randint(100000,999999)}",
             "terminalId": f"TERM{random.randint(1000,9999)}",
         },
         "amount": amount,
         "currency": currency,
-        "description": random.choice(["Groceries", "Airtime", "Electricity", "Clothing", "Fuel"]),
+        "description": random.choice(_DESCRIPTIONS),
         "timestamp": _now_iso(),
         "metadata": {
             "reference": f"REF-{transaction_id[:8].upper()}",
-            "location": random.choice(["Cape Town", "Johannesburg", "Durban", "Pretoria", "Gqeberha"]),
+            "location": random.choice(_CITIES),
         },
     }
     return payload
 
 
-def send_http(body: Dict[str, Any], timeout: float = 10.0) -> Optional[requests.Response]:
-    """Send JSON body to MOCK_DATA_URL via HTTP POST."""
+# Cap on in-flight POSTs per interval tick; matches the connector pool size
+SEND_CONCURRENCY = 64
+
+
+async def send_http(session: "aiohttp.ClientSession", body: Union[Dict[str, Any], bytes]) -> Optional[int]:
+    """Send JSON body to MOCK_DATA_URL via HTTP POST and return the status code."""
     global URL
     if not URL:
         init()
@@ -211,28 +292,93 @@ def send_http(body: Dict[str, Any], timeout: float = 10.0) -> Optional[requests.
         print("MOCK_DATA_URL not set in .env. Skipping send.")
         return None
 
-    headers = {"Content-Type": "application/json"}
     try:
-        resp = requests.post(URL, headers=headers, json=body, timeout=timeout)
-        return resp
+        # orjson encodes straight to bytes; posting data= skips aiohttp's own dumps.
+        # Model generators already hand over JSON bytes — forward those untouched.
+        data = body if isinstance(body, bytes) else orjson.dumps(body)
+        async with session.post(URL, data=data) as resp:
+            return resp.status
     except Exception as e:  # Network or request exceptions
         print(f"HTTP error: {e}")
         return None
 
 
-def build_payload(fmt: Literal["iso8583", "iso20022", "c2b", "CitizenToBusiness", "BusinessToBusiness"]) -> Dict[str, Any]:
-    if fmt == "iso8583":
-        return gen_iso_8583()
-    if fmt == "iso20022":
-        return gen_iso_20022()
-    if fmt == "CitizenToBusiness":
-        return gen_model_citizen_to_business()
-    if fmt == "BusinessToBusiness":
-        return gen_model_business_to_business()
-    return gen_citizen_to_business()
+async def _send_one(
+    session: "aiohttp.ClientSession",
+    sem: asyncio.Semaphore,
+    idx: int,
+    fmt: str,
+    body: Union[Dict[str, Any], bytes],
+) -> None:
+    # The producer acquired the semaphore before spawning this task
+    try:
+        status = await send_http(session, body)
+        print(f"[{idx}] Sent {fmt} -> status={'ERR' if status is None else status}")
+    finally:
+        sem.release()
 
 
-def main() -> None:
+# --- Sync fallback (no aiohttp): one pooled keep-alive Session, built lazily ---
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=SEND_CONCURRENCY)
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+        _SESSION.headers["Content-Type"] = "application/json"
+    return _SESSION
+
+
+def send_http_sync(body: Union[Dict[str, Any], bytes], timeout: float = 10.0) -> Optional[int]:
+    """Sync counterpart of send_http; reuses one keep-alive connection pool."""
+    global URL
+    if not URL:
+        init()
+    if not URL:
+        print("MOCK_DATA_URL not set in .env. Skipping send.")
+        return None
+
+    try:
+        data = body if isinstance(body, bytes) else orjson.dumps(body)
+        resp = _get_session().post(URL, data=data, timeout=timeout)
+        return resp.status_code
+    except Exception as e:  # Network or request exceptions
+        print(f"HTTP error: {e}")
+        return None
+
+
+# Format -> generator table; O(1) dispatch instead of chained string compares
+_BUILDERS = {
+    "iso8583": gen_iso_8583,
+    "iso20022": gen_iso_20022,
+    "c2b": gen_citizen_to_business,
+    "CitizenToBusiness": gen_model_citizen_to_business,
+    "BusinessToBusiness": gen_model_business_to_business,
+}
+_FORMATS = tuple(_BUILDERS)
+
+
+def build_payload(fmt: Literal["iso8583", "iso20022", "c2b", "CitizenToBusiness", "BusinessToBusiness"]) -> Union[Dict[str, Any], bytes]:
+    return _BUILDERS.get(fmt, gen_citizen_to_business)()
+
+
+def _print_payload(payload: Union[Dict[str, Any], bytes], pretty: bool) -> None:
+    opt = orjson.OPT_INDENT_2 if pretty else 0
+    if isinstance(payload, bytes):
+        out = orjson.dumps(orjson.loads(payload), option=opt) if opt else payload
+    else:
+        out = orjson.dumps(payload, option=opt)
+    sys.stdout.buffer.write(out + b"\n")
+
+
+def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate and send mock payment data")
     parser.add_argument(
         "--format",
@@ -267,29 +413,83 @@ def main() -> None:
     parser.add_argument(
         "--pretty", action="store_true", help="Pretty-print JSON payloads"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help=(
+            "Generator processes to run (default: 1). Payload building is "
+            f"CPU-bound; use up to {os.cpu_count()} to scale past one core."
+        ),
+    )
+    return parser.parse_args()
+
 
+async def _run(args: argparse.Namespace, count: int) -> None:
+    """Generate and send `count` messages (0 = infinite) on this process."""
     init()
 
+    # Finite runs that can emit iso8583 get their scalars pre-drawn in bulk
+    if count and args.format in (None, "random", "iso8583"):
+        presample_iso8583(count)
+
+    connector = aiohttp.TCPConnector(limit=SEND_CONCURRENCY, ttl_dns_cache=300)
+    sem = asyncio.Semaphore(SEND_CONCURRENCY)
     idx = 0
-    try:
+    tasks: set = set()
+    async with aiohttp.ClientSession(
+        connector=connector, headers={"Content-Type": "application/json"}
+    ) as session:
         while True:
             idx += 1
             if args.format is None or args.format == "random":
-                r = random.randint(0, 2**31 - 1)
-                mod = r % 4
-                fmt = "iso8583" if mod == 0 else ("iso20022" if mod == 1 else ("c2b" if mod == 2 else ("CitizenToBusiness" if mod == 3  else "BusinessToBusiness")))
+                fmt = random.choice(_FORMATS)
             else:
                 fmt = args.format
             payload = build_payload(fmt)
             if args.dry_run:
-                print(json.dumps(payload, indent=2 if args.pretty else None))
+                _print_payload(payload, args.pretty)
             else:
-                resp = send_http(payload)
-                status = resp.status_code if resp is not None else "ERR"
-                print(f"[{idx}] Sent {fmt} -> status={status}")
+                # Acquiring here (released in _send_one) bounds in-flight
+                # tasks at creation time and yields to the event loop every
+                # iteration, so sends overlap generation even with interval 0
+                await sem.acquire()
+                task = asyncio.create_task(_send_one(session, sem, idx, fmt, payload))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
             # Stop if a finite count was requested
-            if args.count and idx >= args.count:
+            if count and idx >= count:
+                break
+            if args.interval > 0:
+                await asyncio.sleep(args.interval)
+        # Drain in-flight sends before closing the session
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def _run_sync(args: argparse.Namespace, count: int) -> None:
+    """Fallback send loop over the pooled Session when aiohttp is missing."""
+    init()
+
+    if count and args.format in (None, "random", "iso8583"):
+        presample_iso8583(count)
+
+    idx = 0
+    try:
+        while True:
+            idx += 1
+            if args.format is None or args.format == "random":
+                fmt = random.choice(_FORMATS)
+            else:
+                fmt = args.format
+            payload = build_payload(fmt)
+            if args.dry_run:
+                _print_payload(payload, args.pretty)
+            else:
+                status = send_http_sync(payload)
+                print(f"[{idx}] Sent {fmt} -> status={'ERR' if status is None else status}")
+            if count and idx >= count:
                 break
             if args.interval > 0:
                 time.sleep(args.interval)
@@ -297,6 +497,40 @@ def main() -> None:
         print("Interrupted by user")
 
 
+def _run_entry(args: argparse.Namespace, count: int) -> None:
+    if aiohttp is None:
+        _run_sync(args, count)
+    else:
+        # SIGINT surfaces as KeyboardInterrupt from asyncio.run itself (the
+        # task body sees CancelledError), so the handler must sit out here
+        try:
+            asyncio.run(_run(args, count))
+        except KeyboardInterrupt:
+            print("Interrupted by user")
+
+
+def _worker_main(job: tuple) -> None:
+    """Entry point for one generator process: seed, then run its shard."""
+    count, args, seed = job
+    random.seed(seed)
+    _run_entry(args, count)
+
+
+def main() -> None:
+    args = _parse_args()
+    if args.workers > 1:
+        # Shard --count across workers (0 = every worker runs until interrupted)
+        if args.count:
+            base, rem = divmod(args.count, args.workers)
+            counts = [base + (1 if i < rem else 0) for i in range(args.workers)]
+        else:
+            counts = [0] * args.workers
+        jobs = [(n, args, seed) for seed, n in enumerate(counts) if n or not args.count]
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            pool.map(_worker_main, jobs)
+    else:
+        _run_entry(args, args.count)
+
+
 if __name__ == "__main__":
     main()
-    
\ No newline at end of file
@@ -1,23 +1,27 @@
 from fastapi import APIRouter
 from Data.gnn import Product
 from neomodel import db
-import datetime
+from datetime import datetime
 
 router = APIRouter()
 
 query = """
 MATCH (m:Manufacturer)-[r:SUPPLIES_TO]->(b:Business)-[:SELLS]->(p:Product)
-WHERE p.name = $product_name AND r.date >= $start_date
+WHERE p.product_id = $product_id AND r.date >= $start_date
 RETURN m.name, b.name, p.name, r.amount, r.quantity, r.date
 """
 
+_ROW_KEYS = ("manufacturer", "business", "product", "amount", "quantity", "date")
+
 @router.get("/product/{product_id}")
 async def get_product(product_id: int):
-    
+
     results, meta = db.cypher_query(query, {
-        "start_date": datetime(2025, 1, 1)
+        "product_id": product_id,
+        "start_date": datetime(2025, 1, 1),
     })
 
-    for row in results:
-        print(row)
-    return {"product_id": product_id}
\ No newline at end of file
+    return {
+        "product_id": product_id,
+        "rows": [dict(zip(_ROW_KEYS, row)) for row in results],
+    }
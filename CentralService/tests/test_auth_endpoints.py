@@ -11,7 +11,10 @@ from CentralService.auth import router
 from Data.models import Base, get_db as models_get_db
 
 
-def create_test_app_and_db():
+@pytest.fixture(scope="session")
+def app_and_engine():
+    # Built once per test session: table creation and router setup dominated
+    # test wall-clock when repeated per test.
     # In-memory SQLite that persists across connections in the same process
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
@@ -19,13 +22,31 @@ def create_test_app_and_db():
         poolclass=StaticPool,
         future=True,
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
     # Create tables
     Base.metadata.create_all(bind=engine)
 
     app = FastAPI()
     app.include_router(router)
+    return app, engine
+
+
+@pytest.fixture()
+def client(app_and_engine):
+    app, engine = app_and_engine
+
+    # Per-test isolation via an outer transaction: sessions join it with
+    # SAVEPOINTs, so handler commits stay visible within the test and the
+    # rollback below discards everything afterwards.
+    connection = engine.connect()
+    trans = connection.begin()
+    TestingSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        future=True,
+        join_transaction_mode="create_savepoint",
+    )
 
     def override_get_db():
         db = TestingSessionLocal()
@@ -36,14 +57,13 @@ def create_test_app_and_db():
 
     # Override the dependency used in the router with our testing session
     app.dependency_overrides[models_get_db] = override_get_db
-    return app
-
-
-@pytest.fixture()
-def client():
-    app = create_test_app_and_db()
-    with TestClient(app) as c:
-        yield c
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+        trans.rollback()
+        connection.close()
 
 
 def test_register_citizen_success_and_login(client: TestClient):
@@ -2,7 +2,7 @@ import os
 from neomodel import (
     StructuredNode, StructuredRel,
     StringProperty, IntegerProperty, FloatProperty, DateTimeProperty,
-    RelationshipTo, RelationshipFrom, config
+    RelationshipTo, RelationshipFrom, config, db
 )
 
 
@@ -31,6 +31,14 @@ def configure_neo4j(url: str | None = None) -> str:
     """Configure neomodel DATABASE_URL and return the URL used."""
     url = url or os.getenv("NEO4J_URL") or get_compose_neo4j_url()
     config.DATABASE_URL = url
+    try:
+        # Supplychain lookups filter on Product.product_id; make sure it is indexed
+        db.cypher_query(
+            "CREATE INDEX product_id_idx IF NOT EXISTS FOR (p:Product) ON (p.product_id)"
+        )
+    except Exception:
+        # No reachable Neo4j at startup (tests/local dev); index creation is best-effort
+        pass
     return url
 
 
@@ -27,7 +27,17 @@ def get_compose_postgres_url(
 
 # --- Database session setup (compose-aware with local fallback) ---
 DATABASE_URL = os.getenv("DATABASE_URL") or os.getenv("POSTGRES_URL") or get_compose_postgres_url()
-engine = create_engine(DATABASE_URL, future=True, echo=False)
+# One session per request via Depends(get_db): the default pool of 5 throttles
+# concurrency, so size it for the API load pattern and recycle/ping stale conns
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    future=True,
+    echo=False,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
 
 # Ensure tables exist for local/dev usage
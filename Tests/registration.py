@@ -1,20 +1,138 @@
-import os
-import uuid
+import functools
+import itertools
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-import requests
+import socket
+import threading
+
+import orjson
 
 
 BASE_URL = os.getenv("CENTRAL_BASE_URL", "http://localhost:8080")
+_BASE = BASE_URL.rstrip('/')
 TIMEOUT = float(os.getenv("CENTRAL_HTTP_TIMEOUT", "10"))
 
+# Small JSON POSTs stall on Nagle + delayed-ACK (up to ~40ms per exchange);
+# TCP_NODELAY on the pooled sockets removes that, and keep-alive probes hold
+# the warm connection open between calls
+_SOCKET_OPTIONS = [
+	(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+	(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+# The HTTP stack is built lazily: importing this module just for
+# register_citizen/register_business (batch scripts, tests with a mocked
+# post_json) should not pay the requests + urllib3 import or open sockets.
+# Initialization is lock-guarded because the executor in _run_cases fires the
+# first two POSTs concurrently.
+_INIT_LOCK = threading.Lock()
+_SESSION = None
+_HTTP2_CLIENT = None
+_HTTP2_TRIED = False
+
+
+def _get_session():
+	# One keep-alive session for the whole script: reuses the TCP/TLS
+	# connection across all four registrations instead of a fresh handshake
+	# per POST
+	global _SESSION
+	if _SESSION is not None:
+		return _SESSION
+	with _INIT_LOCK:
+		if _SESSION is not None:
+			return _SESSION
+		import requests
+		from requests.adapters import HTTPAdapter
+		from urllib3.util.retry import Retry
+
+		class _NoDelayAdapter(HTTPAdapter):
+			def init_poolmanager(self, *args, **kwargs):
+				kwargs["socket_options"] = _SOCKET_OPTIONS
+				return super().init_poolmanager(*args, **kwargs)
+
+		# Transient 5xx retry within the call, over the already-open
+		# keep-alive socket, instead of failing and re-running the whole
+		# script. POST is not retried by default, so allow it explicitly;
+		# registrations are idempotent-enough here (a retried duplicate
+		# just reports 409).
+		retry = Retry(
+			total=3,
+			backoff_factor=0.2,
+			status_forcelist=(502, 503, 504),
+			allowed_methods=frozenset(["POST"]),
+		)
+		session = requests.Session()
+		adapter = _NoDelayAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+		session.mount("http://", adapter)
+		session.mount("https://", adapter)
+		session.headers.update({"Content-Type": "application/json"})
+		# Guard against anything injecting Expect: 100-continue on the POSTs
+		session.headers["Expect"] = ""
+		# Prime DNS and a pooled keep-alive connection (plus TLS session
+		# tickets on https) before the first real POST; best-effort if the
+		# server is down
+		try:
+			session.head(_BASE + "/", timeout=TIMEOUT)
+		except Exception:
+			pass
+		_SESSION = session
+	return _SESSION
+
+
+def _get_http2_client():
+	# Optional HTTP/2 path: requests is HTTP/1.1-only, so the four POSTs
+	# cannot be multiplexed on one connection. Set CENTRAL_HTTP2=1 (with
+	# httpx + h2 installed) to send them as concurrent streams over a single
+	# connection; the default stays on the pooled requests session, which
+	# the socket/retry tuning above applies to.
+	global _HTTP2_CLIENT, _HTTP2_TRIED
+	if _HTTP2_TRIED:
+		return _HTTP2_CLIENT
+	with _INIT_LOCK:
+		if not _HTTP2_TRIED:
+			if os.getenv("CENTRAL_HTTP2") == "1":
+				try:
+					import httpx
 
-def post_json(path: str, payload: dict) -> requests.Response:
-	url = f"{BASE_URL.rstrip('/')}/{path.lstrip('/')}"
-	headers = {"Content-Type": "application/json"}
-	return requests.post(url, headers=headers, json=payload, timeout=TIMEOUT)
+					_HTTP2_CLIENT = httpx.Client(
+						http2=True,
+						base_url=_BASE,
+						timeout=TIMEOUT,
+						headers={"Content-Type": "application/json"},
+					)
+				except ImportError:
+					pass
+			_HTTP2_TRIED = True
+	return _HTTP2_CLIENT
+
+
+@functools.lru_cache(maxsize=32)
+def _url(path: str) -> str:
+	# Only two distinct paths are ever posted, so the strip + format run once
+	return f"{_BASE}/{path.lstrip('/')}"
+
+
+def post_json_bytes(path: str, body: bytes):
+	# Lowest-overhead send path: the body is already encoded, so requests
+	# passes the bytes straight through with no serialization or charset
+	# work per call. Callers that POST the same payload more than once can
+	# encode it once and reuse the bytes.
+	client = _get_http2_client()
+	if client is not None:
+		return client.post("/" + path.lstrip('/'), content=body)
+	return _get_session().post(_url(path), data=body, timeout=TIMEOUT)
+
+
+def post_json(path: str, payload: dict):
+	# Returns a requests.Response or httpx.Response; both expose status_code,
+	# headers and content, which is all the callers use
+	# orjson encodes straight to bytes; data= skips requests' internal dumps
+	return post_json_bytes(path, orjson.dumps(payload))
 
 
 def register_citizen(
@@ -24,15 +142,20 @@ def register_citizen(
 	email: str,
 	password: str,
 	gov_id: Optional[str] = None,
-) -> requests.Response:
+):
+	# Single literal + filter; no mutate-after-create resizes for the
+	# optional keys
 	payload = {
-		"firstName": first_name,
-		"lastName": last_name,
-		"email": email,
-		"password": password,
+		k: v
+		for k, v in {
+			"firstName": first_name,
+			"lastName": last_name,
+			"email": email,
+			"password": password,
+			"govId": gov_id,
+		}.items()
+		if v is not None
 	}
-	if gov_id:
-		payload["govId"] = gov_id
 	return post_json("/auth/register/citizen", payload)
 
 
@@ -47,88 +170,164 @@ def register_business(
 	address1: str,
 	longitude: Optional[float] = None,
 	latitude: Optional[float] = None,
-) -> requests.Response:
+):
 	payload = {
-		"businessName": business_name,
-		"businessRegId": business_reg_id,
-		"email": email,
-		"password": password,
-		"province": province,
-		"city": city,
-		"address1": address1,
+		k: v
+		for k, v in {
+			"businessName": business_name,
+			"businessRegId": business_reg_id,
+			"email": email,
+			"password": password,
+			"province": province,
+			"city": city,
+			"address1": address1,
+			"longitude": longitude,
+			"latitude": latitude,
+		}.items()
+		if v is not None
 	}
-	if longitude is not None:
-		payload["longitude"] = longitude
-	if latitude is not None:
-		payload["latitude"] = latitude
 	return post_json("/auth/register/business", payload)
 
 
+def register_batch(citizens=(), businesses=()):
+	# One round-trip for every registration in the run; amortizes the
+	# connection and per-request server overhead that dominates the four
+	# individual POSTs. The server does not expose this endpoint yet, so
+	# callers gate on CENTRAL_BATCH and fall back to the per-entity helpers
+	# when it 404s.
+	return post_json("/auth/register/batch", {
+		"citizens": list(citizens),
+		"businesses": list(businesses),
+	})
+
+
+# Fixture ids only need uniqueness within a run, not unpredictability:
+# nanosecond clock + a process-local counter is unique even for back-to-back
+# CENTRAL_REPS iterations, with no entropy syscall at all
+_ctr = itertools.count()
+
+
+def _token(n: int) -> str:
+	return f"{time.time_ns():x}{next(_ctr):x}"[-n:]
+
+
+def _json(r):
+	# Parse straight from the body bytes; avoids requests' text decode + loads
+	return orjson.loads(r.content)
+
+
+# Fallback encoder built once; json.dumps(indent=2) would construct a fresh
+# JSONEncoder on every call
+_ENC = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+
 def pretty(obj) -> str:
 	try:
-		return json.dumps(obj, indent=2, ensure_ascii=False)
+		return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
 	except Exception:
-		return str(obj)
+		try:
+			return _ENC(obj)
+		except Exception:
+			return str(obj)
+
+
+def show(label: str, r) -> None:
+	# One content-type lookup decides the parser; non-JSON bodies decode
+	# r.content directly since r.text would run requests' charset detection
+	ct = r.headers.get('content-type', '')
+	print(f"\n{label}")
+	print(f"Status: {r.status_code}")
+	print(pretty(_json(r) if ct.startswith('application/json') else r.content.decode('utf-8', 'replace')))
 
 
 def main() -> None:
 	print(f"Using base URL: {BASE_URL}")
 
+	# CENTRAL_REPS=N drives the four-case scenario N times over the same
+	# warm session: a reproducible micro-bench for the pooling/socket tuning
+	# above. Each iteration randomizes its own ids, so every run re-exercises
+	# the 201 and 409 paths.
+	reps = int(os.getenv("CENTRAL_REPS", "1"))
+	try:
+		start = time.perf_counter_ns()
+		for _ in range(reps):
+			_run_cases()
+		elapsed_ns = time.perf_counter_ns() - start
+		if reps > 1:
+			total_ms = elapsed_ns / 1e6
+			print(f"\n{reps} iterations ({reps * 4} POSTs) in {total_ms:.1f} ms "
+				f"({total_ms / (reps * 4):.2f} ms/request)")
+	finally:
+		if _SESSION is not None:
+			_SESSION.close()
+		if _HTTP2_CLIENT is not None:
+			_HTTP2_CLIENT.close()
+
+
+def _run_cases() -> None:
+
 	# --- Citizen registration test ---
-	citizen_email = f"cit_{uuid.uuid4().hex[:8]}@example.com"
-	gov_id = f"GOV{uuid.uuid4().hex[:6]}"
-
-	print("\nRegistering citizen (expected 201)...")
-	r1 = register_citizen(
-		first_name="John",
-		last_name="Doe",
-		email=citizen_email,
-		password="s3cret",
-		gov_id=gov_id,
-	)
-	print(f"Status: {r1.status_code}")
-	print(pretty(r1.json() if r1.headers.get('content-type','').startswith('application/json') else r1.text))
-
-	print("\nRegistering same citizen again (expected 409)...")
-	r2 = register_citizen(
-		first_name="John",
-		last_name="Doe",
-		email=citizen_email,  # duplicate email
-		password="s3cret",
-		gov_id=gov_id,        # duplicate govId
-	)
-	print(f"Status: {r2.status_code}")
-	print(pretty(r2.json() if r2.headers.get('content-type','').startswith('application/json') else r2.text))
+	citizen_email = f"cit_{_token(8)}@example.com"
+	gov_id = f"GOV{_token(6)}"
 
 	# --- Business registration test ---
-	business_email = f"biz_{uuid.uuid4().hex[:6]}@example.com"
-	business_reg_id = f"BR{uuid.uuid4().hex[:6]}"
-
-	print("\nRegistering business (expected 201)...")
-	b1 = register_business(
-		business_name="Acme Store",
-		business_reg_id=business_reg_id,
-		email=business_email,
-		password="pw",
-		province="Western Cape",
-		city="Cape Town",
-		address1="123 Main",
-	)
-	print(f"Status: {b1.status_code}")
-	print(pretty(b1.json() if b1.headers.get('content-type','').startswith('application/json') else b1.text))
-
-	print("\nRegistering same business again (expected 409)...")
-	b2 = register_business(
-		business_name="Acme Store",
-		business_reg_id=business_reg_id,  # duplicate
-		email=business_email,              # duplicate
-		password="pw",
-		province="Western Cape",
-		city="Cape Town",
-		address1="123 Main",
-	)
-	print(f"Status: {b2.status_code}")
-	print(pretty(b2.json() if b2.headers.get('content-type','').startswith('application/json') else b2.text))
+	business_email = f"biz_{_token(6)}@example.com"
+	business_reg_id = f"BR{_token(6)}"
+
+	# Wire-format payloads, built once; the register_* helpers stay the
+	# public API for importers, but the driver posts these directly
+	citizen_payload = {
+		"firstName": "John",
+		"lastName": "Doe",
+		"email": citizen_email,
+		"password": "s3cret",
+		"govId": gov_id,
+	}
+	business_payload = {
+		"businessName": "Acme Store",
+		"businessRegId": business_reg_id,
+		"email": business_email,
+		"password": "pw",
+		"province": "Western Cape",
+		"city": "Cape Town",
+		"address1": "123 Main",
+	}
+
+	if os.getenv("CENTRAL_BATCH") == "1":
+		# Single-POST path: the wire payloads mirror the per-entity DTOs
+		# (camelCase). Falls through to the individual calls while the
+		# server lacks the endpoint.
+		rb = register_batch(citizens=[citizen_payload], businesses=[business_payload])
+		if rb.status_code not in (404, 405):
+			show("Batch registration...", rb)
+			return
+		print("\n/auth/register/batch not available; using per-entity calls")
+
+	# Each payload is serialized exactly once; the duplicate phase reuses
+	# the same bytes, so the second round skips payload build + encode
+	cit_body = orjson.dumps(citizen_payload)
+	biz_body = orjson.dumps(business_payload)
+
+	# The citizen and business cases are independent, so each phase's two
+	# POSTs go out concurrently over the pooled session. The duplicate phase
+	# only starts once the first registrations have completed server-side.
+	with ThreadPoolExecutor(max_workers=2) as pool:
+		fut_c = pool.submit(post_json_bytes, "/auth/register/citizen", cit_body)
+		fut_b = pool.submit(post_json_bytes, "/auth/register/business", biz_body)
+		r1, b1 = fut_c.result(), fut_b.result()
+
+		fut_c = pool.submit(post_json_bytes, "/auth/register/citizen", cit_body)  # duplicate email + govId
+		fut_b = pool.submit(post_json_bytes, "/auth/register/business", biz_body)  # duplicate email + regId
+		r2, b2 = fut_c.result(), fut_b.result()
+
+	cases = [
+		("Registering citizen (expected 201)...", r1),
+		("Registering same citizen again (expected 409)...", r2),
+		("Registering business (expected 201)...", b1),
+		("Registering same business again (expected 409)...", b2),
+	]
+	for label, r in cases:
+		show(label, r)
 
 
 if __name__ == "__main__":